@@ -5,12 +5,12 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-import re
+from functools import partial
 
 import aiohttp
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import Event, HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr
 from pyalarmdotcomajax import OtpRequired
@@ -18,6 +18,7 @@ from pyalarmdotcomajax.exceptions import (
     AlarmdotcomException,
     AuthenticationFailed,
     ConfigureTwoFactorAuthentication,
+    UnkonwnDevice,
 )
 
 from .const import (
@@ -28,7 +29,9 @@ from .const import (
     CONF_NO_ENTRY_DELAY,
     CONF_SILENT_ARM,
     DATA_CONTROLLER,
+    DATA_DEBUG_LISTENER,
     DEBUG_REQ_EVENT,
+    DEVICE_TYPE_PLATFORMS,
     DOMAIN,
     PLATFORMS,
     SENSOR_SUBTYPE_BLACKLIST,
@@ -38,6 +41,19 @@ from .controller import AlarmIntegrationController
 
 LOGGER = logging.getLogger(__name__)
 
+# Pre-v4 arm mode option values and their replacements.
+_LEGACY_ARM_OPTIONS = {"bypass": CONF_FORCE_BYPASS, "silent": CONF_SILENT_ARM, "delay": CONF_NO_ENTRY_DELAY}
+
+# Options replaced by the per-mode arm options in v3.
+_DEPRECATED_OPTIONS = ("use_arm_code", "force_bypass", "silent_arming", "no_entry_delay")
+
+# Pre-v3 arming profile values that applied to each arm mode.
+_LEGACY_ARM_PROFILES = {
+    CONF_ARM_HOME: frozenset({"Stay Only", "Always"}),
+    CONF_ARM_AWAY: frozenset({"Away Only", "Always"}),
+    CONF_ARM_NIGHT: frozenset({"Always"}),
+}
+
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Set up alarmdotcom hub from a config entry."""
@@ -48,7 +64,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         # Print startup message
         LOGGER.info(STARTUP_MESSAGE)
 
-    hass.data.setdefault(DOMAIN, {})
+        hass.data[DOMAIN] = {}
 
     #
     # Initialize Alarm.com Connection & Data Update Coordinator
@@ -79,80 +95,125 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     config_entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, controller.stop))
 
     #
-    # Delete devices from Home Assistant that are no longer present on Alarm.com.
+    # Sync device registry with Alarm.com
     #
 
+    _async_sync_device_registry(hass, config_entry, controller)
+
+    # Create real devices. Skip platforms that would not create any entities for this account.
+    device_platforms = {Platform.BINARY_SENSOR, Platform.BUTTON}
+    for device_type in {type(device) for device in controller.api.devices.all.values()}:
+        device_platforms.update(DEVICE_TYPE_PLATFORMS.get(device_type, ()))
+
+    controller.platforms = [platform for platform in PLATFORMS if platform in device_platforms]
+
+    await hass.config_entries.async_forward_entry_setups(config_entry, controller.platforms)
+
+    # Listen for debug entity requests. A single listener serves all config entries. Its unsubscribe callback is kept
+    # beside hass.data[DOMAIN] rather than inside it so that hass.data[DOMAIN] only maps config entry IDs to entry data.
+    if DATA_DEBUG_LISTENER not in hass.data:
+        hass.data[DATA_DEBUG_LISTENER] = hass.bus.async_listen(
+            DEBUG_REQ_EVENT, partial(_async_handle_debug_request_event, hass)
+        )
+
+    LOGGER.info("%s: Finished initializing Alarmdotcom from config entry.", __name__)
+
+    return True
+
+
+@callback
+def _async_sync_device_registry(
+    hass: HomeAssistant, config_entry: ConfigEntry, controller: AlarmIntegrationController
+) -> None:
+    """Delete devices that are no longer present on Alarm.com and create virtual devices."""
+
     device_registry = dr.async_get(hass)
+    adc_devices = controller.api.devices
 
     # Get devices from Alarm.com
-    device_ids_via_adc: set[str] = set()
-    for device in controller.api.devices.all.values():
-        if device.device_subtype not in SENSOR_SUBTYPE_BLACKLIST and device.has_state:
-            device_ids_via_adc.add(device.id_)
+    device_ids_via_adc: set[str] = {
+        device.id_
+        for device in adc_devices.all.values()
+        if device.device_subtype not in SENSOR_SUBTYPE_BLACKLIST and device.has_state
+    }
 
     # Purge deleted devices from Home Assistant
-    for deleted_device in list(device_registry.deleted_devices.values()):
-        for identifier in deleted_device.identifiers:
-            if identifier[0] == DOMAIN:
-                LOGGER.info("Removing orphaned device from Home Assistant: %s", deleted_device.identifiers)
-                del device_registry.deleted_devices[deleted_device.id]
+    deleted_device_ids = [
+        deleted_device.id
+        for deleted_device in device_registry.deleted_devices.values()
+        if any(identifier[0] == DOMAIN for identifier in deleted_device.identifiers)
+    ]
+
+    for deleted_device_id in deleted_device_ids:
+        LOGGER.info(
+            "Removing orphaned device from Home Assistant: %s",
+            device_registry.deleted_devices[deleted_device_id].identifiers,
+        )
+        del device_registry.deleted_devices[deleted_device_id]
 
-    # Will be used during virtual device creation.
-    device_ids_via_hass: set[str] = set()
+    # Decide which Home Assistant devices to keep in a single pass over the device registry.
+    device_ids_via_hass: set[str] = set()  # Will be used during virtual device creation.
+    orphaned_device_entries: list[dr.DeviceEntry] = []
 
-    # Compare against device registry
     for device_entry in dr.async_entries_for_config_entry(device_registry, config_entry.entry_id):
-        for identifier in device_entry.identifiers:
-            if identifier[1] is None:
-                continue
-
-            matched_id: str
-
-            try:
-                # Remove _debug, _malfunction, etc. from IDs
-                id_matches = re.search(r"([0-9]+-[0-9]+)(?:_[a-zA-Z_]+)*", identifier[1])
-            except TypeError:
-                matched_id = identifier[1]
-            else:
-                if id_matches is not None:
-                    matched_id = id_matches.group(1)
-
-            if id_matches is not None and identifier[0] == DOMAIN and matched_id in device_ids_via_adc:
-                device_ids_via_hass.add(identifier[1])
-                break
-
-            LOGGER.info(
-                "Removing device no longer present on Alarm.com: %s (%s | %s)",
-                device_entry.name,
-                device_entry.identifiers,
-                device_entry.id,
-            )
-
-            device_registry.async_remove_device(device_entry.id)
+        # Remove _debug, _malfunction, etc. from IDs
+        current_adc_ids = device_ids_via_adc.intersection(
+            identifier[1].split("_", 1)[0]
+            for identifier in device_entry.identifiers
+            if identifier[0] == DOMAIN and isinstance(identifier[1], str)
+        )
+
+        if current_adc_ids:
+            device_ids_via_hass.update(current_adc_ids)
+        else:
+            orphaned_device_entries.append(device_entry)
+
+    remove_device = device_registry.async_remove_device
+
+    for device_entry in orphaned_device_entries:
+        LOGGER.info(
+            "Removing device no longer present on Alarm.com: %s (%s | %s)",
+            device_entry.name,
+            device_entry.identifiers,
+            device_entry.id,
+        )
+
+        remove_device(device_entry.id)
 
     # Create virtual DEVICES.
     # Currently, only Skybell cameras are virtual devices. We support modifying configuration attributes but not viewing video.
-    for camera in controller.api.devices.cameras.values():
+    get_or_create_device = device_registry.async_get_or_create
+
+    for camera in adc_devices.cameras.values():
         # Check if camera already created.
         if camera.id_ in device_ids_via_hass:
             continue
 
-        device_registry.async_get_or_create(
+        # Only link cameras by MAC address when Alarm.com reports one. pyalarmdotcomajax returns a missing MAC as "None".
+        mac_address = camera.mac_address
+
+        get_or_create_device(
             config_entry_id=config_entry.entry_id,
-            connections={(dr.CONNECTION_NETWORK_MAC, str(camera.mac_address))},
+            connections=(
+                {(dr.CONNECTION_NETWORK_MAC, mac_address)} if mac_address and mac_address != "None" else None
+            ),
             identifiers={(DOMAIN, camera.id_)},
             name=camera.name,
             model="Skybell HD",
             manufacturer="Skybell",
         )
 
-    # Create real devices
-    await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
 
-    async def handle_alarmdotcom_debug_request_event(event: Event) -> None:
-        """Dump debug data when requested via Home Assistant event."""
+async def _async_handle_debug_request_event(hass: HomeAssistant, event: Event) -> None:
+    """Dump debug data when requested via Home Assistant event."""
+
+    device_id = str(event.data.get("device_id"))
 
-        event_device = controller.api.devices.get(str(event.data.get("device_id")))
+    for entry_data in hass.data[DOMAIN].values():
+        try:
+            event_device = entry_data[DATA_CONTROLLER].api.devices.get(device_id)
+        except UnkonwnDevice:
+            continue
 
         LOGGER.warning(
             "ALARM.COM DEBUG DATA FOR %s: %s",
@@ -160,12 +221,9 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
             json.dumps(event_device.debug_data),
         )
 
-    # Listen for debug entity requests
-    hass.bus.async_listen(DEBUG_REQ_EVENT, handle_alarmdotcom_debug_request_event)
-
-    LOGGER.info("%s: Finished initializing Alarmdotcom from config entry.", __name__)
+        return
 
-    return True
+    LOGGER.warning("Cannot dump debug data. No Alarm.com device found with ID %s.", device_id)
 
 
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
@@ -186,7 +244,7 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
 
         config_entry.version = 2
 
-        hass.config_entries.async_update_entry(config_entry, data={**config_entry.data}, options=v2_options)
+        hass.config_entries.async_update_entry(config_entry, options=v2_options)
 
         LOGGER.info("Migration to version %s successful", config_entry.version)
 
@@ -202,56 +260,27 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
         if not v3_options.get("use_arm_code"):
             v3_options["arm_code"] = None
 
-        # Populate Arm Home
-        new_arm_home = []
-
-        if v3_options.get("force_bypass") in ["Stay Only", "Always"]:
-            new_arm_home.append("bypass")
-        if v3_options.get("silent_arming") in ["Stay Only", "Always"]:
-            new_arm_home.append("silent")
-        if v3_options.get("no_entry_delay") not in ["Stay Only", "Always"]:
-            new_arm_home.append("delay")
-
-        v3_options[CONF_ARM_HOME] = new_arm_home
-
-        # Populate Arm Away
-        new_arm_away = []
+        # Populate Arm Home, Away, and Night from the arming profiles that applied to each mode.
+        for arm_mode, arm_profiles in _LEGACY_ARM_PROFILES.items():
+            new_arm_options = []
 
-        if v3_options.get("force_bypass") in ["Away Only", "Always"]:
-            new_arm_away.append("bypass")
-        if v3_options.get("silent_arming") in ["Away Only", "Always"]:
-            new_arm_away.append("silent")
-        if v3_options.get("no_entry_delay") not in ["Away Only", "Always"]:
-            new_arm_away.append("delay")
+            if v3_options.get("force_bypass") in arm_profiles:
+                new_arm_options.append("bypass")
+            if v3_options.get("silent_arming") in arm_profiles:
+                new_arm_options.append("silent")
+            if v3_options.get("no_entry_delay") not in arm_profiles:
+                new_arm_options.append("delay")
 
-        v3_options[CONF_ARM_AWAY] = new_arm_away
-
-        # Populate Arm Night
-        new_arm_night = []
-
-        if v3_options.get("force_bypass") == "Always":
-            new_arm_night.append("bypass")
-        if v3_options.get("silent_arming") == "Always":
-            new_arm_night.append("silent")
-        if v3_options.get("no_entry_delay") != "Always":
-            new_arm_night.append("delay")
-
-        v3_options[CONF_ARM_NIGHT] = new_arm_night
+            v3_options[arm_mode] = new_arm_options
 
         config_entry.version = 3
 
         # Purge deprecated config options.
 
-        if v3_options.get("use_arm_code"):
-            v3_options["use_arm_code"] = None
-        if v3_options.get("force_bypass"):
-            v3_options["force_bypass"] = None
-        if v3_options.get("silent_arming"):
-            v3_options["silent_arming"] = None
-        if v3_options.get("no_entry_delay"):
-            v3_options["no_entry_delay"] = None
+        for deprecated_option in _DEPRECATED_OPTIONS:
+            v3_options.pop(deprecated_option, None)
 
-        hass.config_entries.async_update_entry(config_entry, data={**config_entry.data}, options=v3_options)
+        hass.config_entries.async_update_entry(config_entry, options=v3_options)
 
         LOGGER.info("Migration to version %s successful", config_entry.version)
 
@@ -264,28 +293,18 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
 
         v4_options: dict = {**config_entry.options}
 
-        # Purge config options deprecated and set to None in v3 migration.
-        v4_options.pop("use_arm_code", None)
-        v4_options.pop("force_bypass", None)
-        v4_options.pop("silent_arming", None)
-        v4_options.pop("no_entry_delay", None)
+        # Purge config options that older v3 migrations set to None instead of removing.
+        for deprecated_option in _DEPRECATED_OPTIONS:
+            v4_options.pop(deprecated_option, None)
 
         # Make config option names more explicit. This allows for future rollout of selective bypass when arming.
         for arm_mode in (CONF_ARM_HOME, CONF_ARM_AWAY, CONF_ARM_NIGHT):
             if arm_mode in v4_options:
-                if "bypass" in v4_options[arm_mode]:
-                    v4_options[arm_mode].remove("bypass")
-                    v4_options[arm_mode].append(CONF_FORCE_BYPASS)
-                if "silent" in v4_options[arm_mode]:
-                    v4_options[arm_mode].remove("silent")
-                    v4_options[arm_mode].append(CONF_SILENT_ARM)
-                if "delay" in v4_options[arm_mode]:
-                    v4_options[arm_mode].remove("delay")
-                    v4_options[arm_mode].append(CONF_NO_ENTRY_DELAY)
+                v4_options[arm_mode] = [_LEGACY_ARM_OPTIONS.get(option, option) for option in v4_options[arm_mode]]
 
         config_entry.version = 4
 
-        hass.config_entries.async_update_entry(config_entry, data={**config_entry.data}, options=v4_options)
+        hass.config_entries.async_update_entry(config_entry, options=v4_options)
 
         LOGGER.info("Migration to version %s successful", config_entry.version)
 
@@ -297,10 +316,14 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
 
     controller: AlarmIntegrationController = hass.data[DOMAIN].pop(config_entry.entry_id)[DATA_CONTROLLER]
 
-    controller.api.stop_websocket()
-    controller.stop_keep_alive()
+    # Stops the websocket and keep-alive task and closes the controller's websession.
+    await controller.stop()
+
+    # Stop listening for debug requests once the last config entry is unloaded.
+    if not hass.data[DOMAIN] and (stop_debug_listener := hass.data.pop(DATA_DEBUG_LISTENER, None)):
+        stop_debug_listener()
 
-    unload_ok: bool = await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
+    unload_ok: bool = await hass.config_entries.async_unload_platforms(config_entry, controller.platforms)
     if unload_ok:
         LOGGER.debug("%s: Unloaded Alarm.com config entry.", __name__)
 
@@ -3,9 +3,7 @@
 from __future__ import annotations
 
 import logging
-import re
-from collections.abc import Mapping
-from typing import Any
+from collections.abc import Awaitable, Callable, Collection
 
 from homeassistant import core
 from homeassistant.components.alarm_control_panel import (
@@ -42,6 +40,24 @@ from .controller import AlarmIntegrationController
 
 LOGGER = logging.getLogger(__name__)
 
+BASE_SUPPORTED_FEATURES = AlarmControlPanelEntityFeature.ARM_HOME | AlarmControlPanelEntityFeature.ARM_AWAY
+
+# Home Assistant states for partitions that have reached their desired state.
+SETTLED_STATES = {
+    libPartition.DeviceState.DISARMED: STATE_ALARM_DISARMED,
+    libPartition.DeviceState.ARMED_STAY: STATE_ALARM_ARMED_HOME,
+    libPartition.DeviceState.ARMED_AWAY: STATE_ALARM_ARMED_AWAY,
+    libPartition.DeviceState.ARMED_NIGHT: STATE_ALARM_ARMED_NIGHT,
+}
+
+# Home Assistant states for partitions that are still moving towards their desired state.
+TRANSITION_STATES = {
+    libPartition.DeviceState.DISARMED: STATE_ALARM_DISARMING,
+    libPartition.DeviceState.ARMED_STAY: STATE_ALARM_ARMING,
+    libPartition.DeviceState.ARMED_AWAY: STATE_ALARM_ARMING,
+    libPartition.DeviceState.ARMED_NIGHT: STATE_ALARM_ARMING,
+}
+
 
 async def async_setup_entry(
     hass: core.HomeAssistant,
@@ -77,31 +93,31 @@ class AlarmControlPanel(HardwareBaseDevice, AlarmControlPanelEntity):  # type: i
 
         super().__init__(controller, device)
 
-        self._attr_code_format = (
-            (
-                CodeFormat.NUMBER
-                if (isinstance(arm_code, str) and re.search("^\\d+$", arm_code))
-                else CodeFormat.TEXT
-            )
-            if (arm_code := controller.options.get(CONF_ARM_CODE))
-            else None
-        )
+        # Options changes reload the config entry, so the arm code can't change during this entity's lifetime. An
+        # empty arm code means that no code is required.
+        self._arm_code: str | None = controller.options.get(CONF_ARM_CODE) or None
 
-        self._attr_supported_features = (
-            AlarmControlPanelEntityFeature.ARM_HOME | AlarmControlPanelEntityFeature.ARM_AWAY
-        )
+        self._attr_code_format: CodeFormat | None = None
+
+        if self._arm_code:
+            self._attr_code_format = CodeFormat.NUMBER if self._arm_code.isdecimal() else CodeFormat.TEXT
+
+        self._attr_supported_features = BASE_SUPPORTED_FEATURES
 
         if self._device.supports_night_arming:
             self._attr_supported_features |= AlarmControlPanelEntityFeature.ARM_NIGHT
 
-    @property
-    def extra_state_attributes(self) -> Mapping[str, Any] | None:
-        """Return the state attributes of the entity."""
+        # Arming flags only depend on config entry options, so resolve them once.
+        self._arm_home_kwargs = _build_arm_kwargs(controller.options.get(CONF_ARM_HOME, ()))
+        self._arm_away_kwargs = _build_arm_kwargs(controller.options.get(CONF_ARM_AWAY, ()))
+        self._arm_night_kwargs = _build_arm_kwargs(controller.options.get(CONF_ARM_NIGHT, ()))
+
+    def _refresh_extra_state_attributes(self) -> None:
+        """Update extra state attributes when device is updated."""
 
-        return {
-            "uncleared_issues": str(self._device.uncleared_issues),
-            **getattr(super(), "extra_state_attributes", {}),
-        }
+        super()._refresh_extra_state_attributes()
+
+        self._attr_extra_state_attributes["uncleared_issues"] = str(self._device.uncleared_issues)
 
     @property
     def state(self) -> str | None:
@@ -110,30 +126,20 @@ class AlarmControlPanel(HardwareBaseDevice, AlarmControlPanelEntity):  # type: i
         if self._device.malfunction:
             return None
 
-        if self._device.state == self._device.desired_state:
-            match self._device.state:
-                case libPartition.DeviceState.DISARMED:
-                    return str(STATE_ALARM_DISARMED)
-                case libPartition.DeviceState.ARMED_STAY:
-                    return str(STATE_ALARM_ARMED_HOME)
-                case libPartition.DeviceState.ARMED_AWAY:
-                    return str(STATE_ALARM_ARMED_AWAY)
-                case libPartition.DeviceState.ARMED_NIGHT:
-                    return str(STATE_ALARM_ARMED_NIGHT)
-        else:
-            match self._device.desired_state:
-                case libPartition.DeviceState.DISARMED:
-                    return str(STATE_ALARM_DISARMING)
-                case (
-                    libPartition.DeviceState.ARMED_STAY
-                    | libPartition.DeviceState.ARMED_AWAY
-                    | libPartition.DeviceState.ARMED_NIGHT
-                ):
-                    return str(STATE_ALARM_ARMING)
+        # Device state properties are derived from raw attributes on each access. Read them once.
+        raw_state = self._device.state
+        desired_state = self._device.desired_state
+
+        if raw_state == desired_state:
+            if (state := SETTLED_STATES.get(raw_state)) is not None:
+                return state
+        elif (state := TRANSITION_STATES.get(desired_state)) is not None:
+            return state
 
         LOGGER.error(
-            f"Cannot determine state. Found raw state of {self._device.state} and desired state of"
-            f" {self._device.desired_state}."
+            "Cannot determine state. Found raw state of %s and desired state of %s.",
+            raw_state,
+            desired_state,
         )
 
         return None
@@ -149,58 +155,51 @@ class AlarmControlPanel(HardwareBaseDevice, AlarmControlPanelEntity):  # type: i
     async def async_alarm_arm_night(self, code: str | None = None) -> None:
         """Send arm night command."""
 
-        arm_options = self._controller.options.get(CONF_ARM_NIGHT, {})
-
-        if self._validate_code(code):
-            try:
-                await self._device.async_arm_night(
-                    force_bypass=CONF_FORCE_BYPASS in arm_options,
-                    no_entry_delay=CONF_NO_ENTRY_DELAY in arm_options,
-                    silent_arming=CONF_SILENT_ARM in arm_options,
-                )
-            except NotAuthorized:
-                self._show_permission_error("arm_night")
+        await self._async_arm(self._device.async_arm_night, self._arm_night_kwargs, "arm_night", code)
 
     async def async_alarm_arm_home(self, code: str | None = None) -> None:
         """Send arm home command."""
 
-        arm_options = self._controller.options.get(CONF_ARM_HOME, {})
-
-        if self._validate_code(code):
-            try:
-                await self._device.async_arm_stay(
-                    force_bypass=CONF_FORCE_BYPASS in arm_options,
-                    no_entry_delay=CONF_NO_ENTRY_DELAY in arm_options,
-                    silent_arming=CONF_SILENT_ARM in arm_options,
-                )
-            except NotAuthorized:
-                self._show_permission_error("arm_home")
+        await self._async_arm(self._device.async_arm_stay, self._arm_home_kwargs, "arm_home", code)
 
     async def async_alarm_arm_away(self, code: str | None = None) -> None:
         """Send arm away command."""
 
-        arm_options = self._controller.options.get(CONF_ARM_AWAY, {})
-
-        if self._validate_code(code):
-            try:
-                await self._device.async_arm_away(
-                    force_bypass=CONF_FORCE_BYPASS in arm_options,
-                    no_entry_delay=CONF_NO_ENTRY_DELAY in arm_options,
-                    silent_arming=CONF_SILENT_ARM in arm_options,
-                )
-            except NotAuthorized:
-                self._show_permission_error("arm_away")
+        await self._async_arm(self._device.async_arm_away, self._arm_away_kwargs, "arm_away", code)
 
     #
     # Helpers
     #
 
-    def _validate_code(self, code: str | None) -> bool | str:
+    async def _async_arm(
+        self,
+        arm_fn: Callable[..., Awaitable[None]],
+        arm_kwargs: dict[str, bool],
+        action: str,
+        code: str | None,
+    ) -> None:
+        """Validate code and send arm command."""
+
+        if self._validate_code(code):
+            try:
+                await arm_fn(**arm_kwargs)
+            except NotAuthorized:
+                self._show_permission_error(action)
+
+    def _validate_code(self, code: str | None) -> bool:
         """Validate given code."""
-        check: bool | str = (arm_code := self._controller.options.get(CONF_ARM_CODE)) in [
-            None,
-            "",
-        ] or code == arm_code
-        if not check:
-            LOGGER.warning("Wrong code entered.")
-        return check
+        if self._arm_code is None or code == self._arm_code:
+            return True
+
+        LOGGER.warning("Wrong code entered.")
+        return False
+
+
+def _build_arm_kwargs(arm_options: Collection[str]) -> dict[str, bool]:
+    """Convert arm mode config options into pyalarmdotcomajax arming arguments."""
+
+    return {
+        "force_bypass": CONF_FORCE_BYPASS in arm_options,
+        "no_entry_delay": CONF_NO_ENTRY_DELAY in arm_options,
+        "silent_arming": CONF_SILENT_ARM in arm_options,
+    }
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import contextlib
 import logging
-from collections.abc import Mapping, MutableMapping
+from collections.abc import MutableMapping
 from typing import Any, Final
 
 from homeassistant.components import persistent_notification
@@ -49,6 +49,9 @@ class BaseDevice(CoordinatorEntity):  # type: ignore
 
         self._controller = controller
 
+        # Device objects are rebuilt on every Alarm.com update, but the registry that holds them is not.
+        self._adc_devices = controller.api.devices
+
         self._attr_extra_state_attributes: MutableMapping[str, Any] = {}
 
         self._attr_device_info = DeviceInfo(
@@ -88,29 +91,39 @@ class BaseDevice(CoordinatorEntity):  # type: ignore
     def _handle_coordinator_update(self) -> None:
         """Update the entity with new cordinator-fetched data."""
 
-        super()._handle_coordinator_update()
-
+        # _update_device_data() writes the entity state, so CoordinatorEntity's own state write is skipped.
         self._update_device_data()
 
     def _update_device_data(self) -> None:
         """Device-type specific update processes to run when new device data is available."""
 
-        self._device = self._controller.api.devices.get(self._adc_id)
+        self._device = self._adc_devices.get(self._adc_id)
 
         self._legacy_refresh_attributes()
 
+        self._refresh_extra_state_attributes()
+
         self.async_write_ha_state()
 
         # LOGGER.debug("************** START DEVICE UPDATE *****************")
-        LOGGER.info(
-            f"Updated {self.device_type_name} {self._friendly_name_internal()} ({self._adc_id}): {self.state}"
-        )
+        # Resolving the name and state is not free, so skip it when the message would be discarded.
+        if LOGGER.isEnabledFor(logging.INFO):
+            LOGGER.info(
+                "Updated %s %s (%s): %s",
+                self.device_type_name,
+                self._friendly_name_internal(),
+                self._adc_id,
+                self.state,
+            )
         # LOGGER.debug(json.dumps(self._device.raw_attributes, indent=4, sort_keys=True))
         # LOGGER.debug("************** END DEVICE UPDATE *****************")
 
     def _legacy_refresh_attributes(self) -> None:
         """Update HA when device is updated. Should be overridden by subclasses."""
 
+    def _refresh_extra_state_attributes(self) -> None:
+        """Update extra state attributes when device is updated. Should be overridden by subclasses."""
+
     def _show_permission_error(self, action: str = "") -> None:
         """Show Home Assistant notification.
 
@@ -191,13 +204,12 @@ class HardwareBaseDevice(BaseDevice):
 
         super().__init__(controller, device)
 
-    @property
-    def extra_state_attributes(self) -> Mapping[str, Any] | None:
-        """Return the client state attributes."""
+    def _refresh_extra_state_attributes(self) -> None:
+        """Update the client state attributes."""
 
-        raw = self._controller.api.devices.get(self._adc_id).raw_attributes
+        raw = self._device.raw_attributes
 
-        return {k: raw[k] for k in DEVICE_STATIC_ATTRIBUTES if k in raw}
+        self._attr_extra_state_attributes = {k: raw[k] for k in DEVICE_STATIC_ATTRIBUTES if k in raw}
 
 
 class AttributeBaseDevice(BaseDevice):
@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import logging
 import re
-from collections.abc import Callable, Mapping
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Any, Final
+from typing import Final
 
 from homeassistant import core
 from homeassistant.components.binary_sensor import (
@@ -28,6 +28,12 @@ from .device_type_langs import LANG_DOOR, LANG_WINDOW
 
 LOGGER = logging.getLogger(__name__)
 
+CONTACT_SUBTYPES = frozenset({libSensor.Subtype.CONTACT_SENSOR, libSensor.Subtype.CONTACT_SHOCK_SENSOR})
+GLASS_BREAK_SUBTYPES = frozenset(
+    {libSensor.Subtype.GLASS_BREAK_DETECTOR, libSensor.Subtype.PANEL_GLASS_BREAK_DETECTOR}
+)
+MOTION_SUBTYPES = frozenset({libSensor.Subtype.MOTION_SENSOR, libSensor.Subtype.PANEL_MOTION_SENSOR})
+
 
 @dataclass
 class AlarmdotcomAttributeDescriptionMixin:
@@ -78,17 +84,28 @@ async def async_setup_entry(
     # Create "real" Alarm.com sensors.
     controller: AlarmIntegrationController = hass.data[DOMAIN][config_entry.entry_id][DATA_CONTROLLER]
 
+    # Scan devices once rather than building separate sensor and water sensor dicts. WaterSensor subclasses Sensor.
     async_add_entities(
         BinarySensor(
             controller=controller,
             device=device,
         )
-        for device in [*controller.api.devices.sensors.values(), *controller.api.devices.water_sensors.values()]
-        if device.device_subtype not in SENSOR_SUBTYPE_BLACKLIST and device.has_state
+        for device in controller.api.devices.all.values()
+        if isinstance(device, libSensor)
+        and device.device_subtype not in SENSOR_SUBTYPE_BLACKLIST
+        and device.has_state
     )
 
     # Create "virtual" low battery and malfunction sensors.
 
+    # Snapshot eligible devices once instead of re-checking them for every description.
+    attribute_devices = [
+        device
+        for device in controller.api.devices.all.values()
+        if not (isinstance(device, libSensor) and device.device_subtype in SENSOR_SUBTYPE_BLACKLIST)
+        and device.has_state
+    ]
+
     async_add_entities(
         AttributeBinarySensor(
             controller=controller,
@@ -96,12 +113,8 @@ async def async_setup_entry(
             description=description,
         )
         for description in ATTRIBUTE_BINARY_SENSORS
-        for device in controller.api.devices.all.values()
-        if (
-            description.filter_fn(device)
-            and not (isinstance(device, libSensor) and device.device_subtype in SENSOR_SUBTYPE_BLACKLIST)
-            and device.has_state
-        )
+        for device in attribute_devices
+        if description.filter_fn(device)
     )
 
 
@@ -128,10 +141,7 @@ class BinarySensor(HardwareBaseDevice, BinarySensorEntity):  # type: ignore
 
         # Try to determine whether contact sensor is for a window or door by matching strings.
         derived_class: BinarySensorDeviceClass = None
-        if (raw_subtype := self._device.device_subtype) in [
-            libSensor.Subtype.CONTACT_SENSOR,
-            libSensor.Subtype.CONTACT_SHOCK_SENSOR,
-        ]:
+        if (raw_subtype := self._device.device_subtype) in CONTACT_SUBTYPES:
             for _, word in LANG_DOOR:
                 if (
                     re.search(
@@ -153,10 +163,7 @@ class BinarySensor(HardwareBaseDevice, BinarySensorEntity):  # type: ignore
                 ):
                     derived_class = BinarySensorDeviceClass.WINDOW
 
-        if derived_class is not None and raw_subtype in [
-            libSensor.Subtype.CONTACT_SENSOR,
-            libSensor.Subtype.CONTACT_SHOCK_SENSOR,
-        ]:
+        if derived_class is not None and raw_subtype in CONTACT_SUBTYPES:
             return derived_class
 
         # Water sensor:
@@ -172,15 +179,9 @@ class BinarySensor(HardwareBaseDevice, BinarySensorEntity):  # type: ignore
             return BinarySensorDeviceClass.CO
         if raw_subtype == libSensor.Subtype.PANIC_BUTTON:
             return BinarySensorDeviceClass.SAFETY
-        if raw_subtype in [
-            libSensor.Subtype.GLASS_BREAK_DETECTOR,
-            libSensor.Subtype.PANEL_GLASS_BREAK_DETECTOR,
-        ]:
+        if raw_subtype in GLASS_BREAK_SUBTYPES:
             return BinarySensorDeviceClass.VIBRATION
-        if raw_subtype in [
-            libSensor.Subtype.MOTION_SENSOR,
-            libSensor.Subtype.PANEL_MOTION_SENSOR,
-        ]:
+        if raw_subtype in MOTION_SUBTYPES:
             return BinarySensorDeviceClass.MOTION
         if raw_subtype == libSensor.Subtype.FREEZE_SENSOR:
             return BinarySensorDeviceClass.COLD
@@ -232,16 +233,10 @@ class AttributeBinarySensor(AttributeBaseDevice, BinarySensorEntity):  # type: i
 
         super().__init__(controller, device, description)
 
-    @property
-    def extra_state_attributes(self) -> Mapping[str, Any] | None:
-        """Return the state attributes of the entity."""
-
-        extra_attribs = {}.update(super().extra_state_attributes)
-
-        if extra_attribs := self.entity_description.extra_attribs_fn(self):
-            extra_attribs.update(extra_attribs)
+    def _refresh_extra_state_attributes(self) -> None:
+        """Update extra state attributes when device is updated."""
 
-        return extra_attribs
+        self._attr_extra_state_attributes = self.entity_description.extra_attribs_fn(self) or {}
 
     @property
     def is_on(self) -> bool | None:
@@ -7,7 +7,6 @@ import logging
 from typing import Any, Literal
 
 import aiohttp
-import async_timeout
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_PASSWORD, CONF_UNIT_OF_MEASUREMENT, CONF_USERNAME
@@ -97,43 +96,43 @@ class ADCFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore
 
             self._controller = AlarmIntegrationController(self.hass, self.config)
 
-            async with async_timeout.timeout(60):
-                try:
+            try:
+                async with asyncio.timeout(60):
                     await self._controller.initialize_lite(
                         username=self.config[CONF_USERNAME],
                         password=self.config[CONF_PASSWORD],
                         twofactorcookie=self.config[CONF_2FA_COOKIE],
                     )
 
-                except OtpRequired as exc:
-                    LOGGER.debug("OTP code required.")
-                    self._enabled_otp_methods = exc.enabled_2fa_methods
-                    return await self.async_step_otp_select_method()
-
-                except libConfigureTwoFactorAuthentication:
-                    return self.async_abort(reason="must_enable_2fa")
-
-                except (
-                    TimeoutError,
-                    libUnexpectedResponse,
-                    aiohttp.ClientError,
-                    asyncio.exceptions.CancelledError,
-                ):
-                    LOGGER.exception(
-                        "%s: user login failed to contact Alarm.com.",
-                        __name__,
-                    )
-                    errors["base"] = "cannot_connect"
+            except OtpRequired as exc:
+                LOGGER.debug("OTP code required.")
+                self._enabled_otp_methods = exc.enabled_2fa_methods
+                return await self.async_step_otp_select_method()
 
-                except ConfigEntryAuthFailed:
-                    LOGGER.exception("%s: user login failed with AuthenticationFailed exception.", __name__)
-                    errors["base"] = "invalid_auth"
+            except libConfigureTwoFactorAuthentication:
+                return self.async_abort(reason="must_enable_2fa")
 
-                except AlarmdotcomException:
-                    LOGGER.exception("Got error while initializing Alarm.com.")
-                    errors["base"] = "unknown"
-                else:
-                    return await self.async_step_final()
+            except (
+                TimeoutError,
+                libUnexpectedResponse,
+                aiohttp.ClientError,
+                asyncio.exceptions.CancelledError,
+            ):
+                LOGGER.exception(
+                    "%s: user login failed to contact Alarm.com.",
+                    __name__,
+                )
+                errors["base"] = "cannot_connect"
+
+            except ConfigEntryAuthFailed:
+                LOGGER.exception("%s: user login failed with AuthenticationFailed exception.", __name__)
+                errors["base"] = "invalid_auth"
+
+            except AlarmdotcomException:
+                LOGGER.exception("Got error while initializing Alarm.com.")
+                errors["base"] = "unknown"
+            else:
+                return await self.async_step_final()
 
         creds_schema = vol.Schema(
             {
@@ -158,7 +157,7 @@ class ADCFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore
             )
             if self.otp_method in (OtpType.email, OtpType.sms):
                 # Ask Alarm.com to send OTP if selected method is EMAIL or SMS.
-                LOGGER.debug(f"Requesting One-Time Password via {self.otp_method.name}...")
+                LOGGER.debug("Requesting One-Time Password via %s...", self.otp_method.name)
                 await self._controller.api.async_request_otp(self.otp_method)
 
             return await self.async_step_otp_submit()
@@ -168,7 +167,7 @@ class ADCFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore
             if len(self._enabled_otp_methods) == 1 and self._enabled_otp_methods[0] == OtpType.app:
                 # If APP is the only enabled OTP method, use it without prompting user.
                 self.otp_method = OtpType.app
-                LOGGER.debug(f"Using {self.otp_method.name} for One-Time Password.")
+                LOGGER.debug("Using %s for One-Time Password.", self.otp_method.name)
                 return await self.async_step_otp_submit()
 
         except (TimeoutError, aiohttp.ClientError, libUnexpectedResponse):
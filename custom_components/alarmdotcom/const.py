@@ -6,7 +6,14 @@ import logging
 
 from homeassistant.const import Platform
 from pyalarmdotcomajax import const as libConst
+from pyalarmdotcomajax.devices.camera import Camera as libCamera
+from pyalarmdotcomajax.devices.garage_door import GarageDoor as libGarageDoor
+from pyalarmdotcomajax.devices.gate import Gate as libGate
+from pyalarmdotcomajax.devices.light import Light as libLight
+from pyalarmdotcomajax.devices.lock import Lock as libLock
+from pyalarmdotcomajax.devices.partition import Partition as libPartition
 from pyalarmdotcomajax.devices.sensor import Sensor as libSensor
+from pyalarmdotcomajax.devices.thermostat import Thermostat as libThermostat
 
 INTEGRATION_NAME = "Alarm.com"
 DOMAIN = "alarmdotcom"
@@ -72,19 +79,22 @@ CONF_OPTIONS_DEFAULT = {
     CONF_WEBSOCKET_RECONNECT_TIMEOUT: CONF_DEFAULT_WEBSOCKET_RECONNECT_TIMEOUT,
 }
 
-SENSOR_SUBTYPE_BLACKLIST = [
-    libSensor.Subtype.MOBILE_PHONE,  # No purpose
-    libSensor.Subtype.PANEL_IMAGE_SENSOR,  # No support yet
-    libSensor.Subtype.FIXED_PANIC,  # Doesn't support state reporting
-]
+SENSOR_SUBTYPE_BLACKLIST = frozenset(
+    {
+        libSensor.Subtype.MOBILE_PHONE,  # No purpose
+        libSensor.Subtype.PANEL_IMAGE_SENSOR,  # No support yet
+        libSensor.Subtype.FIXED_PANIC,  # Doesn't support state reporting
+    }
+)
 
 DATA_CONTROLLER = "connection"
+DATA_DEBUG_LISTENER = f"{DOMAIN}_debug_listener"
 
 ATTRIB_BATTERY_NORMAL = "Normal"
 ATTRIB_BATTERY_LOW = "Low"
 ATTRIB_BATTERY_CRITICAL = "Critical"
 
-PLATFORMS = [
+PLATFORMS = (
     Platform.ALARM_CONTROL_PANEL,
     Platform.BINARY_SENSOR,
     Platform.LOCK,
@@ -95,6 +105,18 @@ PLATFORMS = [
     Platform.SWITCH,
     Platform.SELECT,
     Platform.CLIMATE,
-]
+)
+
+# Platforms that only create entities for specific device types. All other platforms create attribute entities for
+# every device type.
+DEVICE_TYPE_PLATFORMS: dict[type, tuple[Platform, ...]] = {
+    libPartition: (Platform.ALARM_CONTROL_PANEL,),
+    libLock: (Platform.LOCK,),
+    libGarageDoor: (Platform.COVER,),
+    libGate: (Platform.COVER,),
+    libLight: (Platform.LIGHT,),
+    libThermostat: (Platform.CLIMATE,),
+    libCamera: (Platform.NUMBER, Platform.SELECT, Platform.SWITCH),
+}
 
 DEVICE_STATIC_ATTRIBUTES = [libConst.ATTR_STATE_TEXT, libConst.ATTR_MAC_ADDRESS]
@@ -11,7 +11,7 @@ from typing import Any
 
 import aiohttp
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
@@ -52,6 +52,9 @@ class AlarmIntegrationController:
 
         self.options: MappingProxyType[str, Any]
 
+        # Platforms set up for this config entry. Unloading uses the same list.
+        self.platforms: list[Platform] = []
+
         self._stop_keep_alive: CALLBACK_TYPE
 
         self._ws_state: WebSocketState = WebSocketState.STOPPED
@@ -62,34 +65,41 @@ class AlarmIntegrationController:
     async def initialize(self) -> None:
         """Initialize connection to Alarm.com."""
 
-        #
-        # Create pyalarmdotcomajax controller
-        #
-
-        await self.initialize_lite(
-            username=self.config_entry.data[CONF_USERNAME],
-            password=self.config_entry.data[CONF_PASSWORD],
-            twofactorcookie=self.config_entry.data.get(CONF_2FA_COOKIE),
-        )
+        try:
+            #
+            # Create pyalarmdotcomajax controller
+            #
+
+            await self.initialize_lite(
+                username=self.config_entry.data[CONF_USERNAME],
+                password=self.config_entry.data[CONF_PASSWORD],
+                twofactorcookie=self.config_entry.data.get(CONF_2FA_COOKIE),
+            )
 
-        #
-        # Initialize DataUpdateCoordinator and pull device data
-        #
+            #
+            # Initialize DataUpdateCoordinator and pull device data
+            #
 
-        self.options = self.config_entry.options
-        self.config_entry.async_on_unload(self.config_entry.add_update_listener(_async_update_listener))
+            self.options = self.config_entry.options
+            self.config_entry.async_on_unload(self.config_entry.add_update_listener(_async_update_listener))
 
-        update_interval = self.config_entry.options.get(CONF_UPDATE_INTERVAL, CONF_DEFAULT_UPDATE_INTERVAL_SECONDS)
+            update_interval = self.config_entry.options.get(
+                CONF_UPDATE_INTERVAL, CONF_DEFAULT_UPDATE_INTERVAL_SECONDS
+            )
 
-        self.update_coordinator = DataUpdateCoordinator(
-            self.hass,
-            LOGGER,
-            name=self.config_entry.title,
-            update_method=self.async_update,
-            update_interval=timedelta(seconds=update_interval),
-        )
+            self.update_coordinator = DataUpdateCoordinator(
+                self.hass,
+                LOGGER,
+                name=self.config_entry.title,
+                update_method=self.async_update,
+                update_interval=timedelta(seconds=update_interval),
+            )
 
-        await self.update_coordinator.async_config_entry_first_refresh()
+            await self.update_coordinator.async_config_entry_first_refresh()
+        except BaseException:
+            # Home Assistant retries a failed setup with a new controller. Don't leave this one's websession open.
+            await self.api.close_websession()
+            raise
 
         #
         # Start keep-alive task
@@ -130,6 +140,8 @@ class AlarmIntegrationController:
     async def initialize_lite(self, username: str, password: str, twofactorcookie: str | None) -> None:
         """Initialize connection to Alarm.com for config entry flow."""
 
+        # Alarm.com authenticates using session cookies, so each controller gets its own websession rather than
+        # sharing Home Assistant's global session. It is closed when the controller stops.
         self.api = libAlarmController(
             username=username,
             password=password,
@@ -201,14 +213,14 @@ class AlarmIntegrationController:
             await asyncio.sleep(ws_reconnect_timeout)
 
     @property
-    def provider_name(self) -> str:
+    def provider_name(self) -> str | None:
         """Return the name of the provider."""
-        return str(self.api.provider_name)
+        return self.api.provider_name
 
     @property
-    def user_email(self) -> str:
+    def user_email(self) -> str | None:
         """Return the user email."""
-        return str(self.api.user_email)
+        return self.api.user_email
 
 
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -34,13 +34,14 @@ async def async_setup_entry(
 
     controller: AlarmIntegrationController = hass.data[DOMAIN][config_entry.entry_id][DATA_CONTROLLER]
 
+    # Scan devices once rather than building separate garage door and gate dicts and concatenating them.
     async_add_entities(
         Cover(
             controller=controller,
             device=device,
         )
-        for device in list(controller.api.devices.garage_doors.values())
-        + list(controller.api.devices.gates.values())
+        for device in controller.api.devices.all.values()
+        if isinstance(device, libGarageDoor | libGate)
     )
 
 
@@ -88,7 +89,7 @@ class Cover(HardwareBaseDevice, CoverEntity):  # type: ignore
     def is_closed(self) -> bool | None:
         """Return true if lock is locked."""
 
-        LOGGER.info("Processing is_closed %s for %s", self._device.state, self.name or self._device.name)
+        # LOGGER.info("Processing is_closed %s for %s", self._device.state, self.name or self._device.name)
 
         if not self._device.malfunction:
             match self._device.state:
@@ -22,6 +22,17 @@ from .controller import AlarmIntegrationController
 
 LOGGER = logging.getLogger(__name__)
 
+# Patterns reported as the lock code format, from most to least restrictive. Digit-only codes are detected with
+# str.isdecimal(), which matches the same characters as \d.
+CODE_FORMAT_DIGITS = r"^\d+$"  # Only digits
+CODE_FORMAT_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"^\w\D+$",  # Only alpha
+        r"^\w+$",  # Alphanumeric
+    )
+)
+
 
 async def async_setup_platform(
     hass: HomeAssistant,
@@ -72,24 +83,28 @@ class Lock(HardwareBaseDevice, LockEntity):  # type: ignore
     _device_type_name: str = "Lock"
     _device: libLock
 
-    @property
-    def code_format(self) -> str | None:
-        """Return the format of the code."""
+    def __init__(
+        self,
+        controller: AlarmIntegrationController,
+        device: libLock,
+    ) -> None:
+        """Pass coordinator to CoordinatorEntity."""
 
-        if code := self._controller.options.get(CONF_ARM_CODE):
-            code_patterns = [
-                r"^\d+$",  # Only digits
-                r"^\w\D+$",  # Only alpha
-                r"^\w+$",  # Alphanumeric
-            ]
+        super().__init__(controller, device)
 
-            for pattern in code_patterns:
-                if re.findall(pattern, code):
-                    return pattern
+        # An empty arm code means that no code is required.
+        self._arm_code: str | None = controller.options.get(CONF_ARM_CODE) or None
 
-            return "."  # All characters
+        self._attr_code_format: str | None = None
 
-        return None
+        if code := self._arm_code:
+            if code.isdecimal():
+                self._attr_code_format = CODE_FORMAT_DIGITS
+            else:
+                self._attr_code_format = next(
+                    (pattern.pattern for pattern in CODE_FORMAT_PATTERNS if pattern.search(code)),
+                    ".",  # All characters
+                )
 
     @property
     def is_locking(self) -> bool | None:
@@ -125,7 +140,9 @@ class Lock(HardwareBaseDevice, LockEntity):  # type: ignore
                     return False
                 case _:
                     LOGGER.error(
-                        f"Cannot determine whether {self.name} is locked. Found raw state of {self._device.state}."
+                        "Cannot determine whether %s is locked. Found raw state of %s.",
+                        self.name,
+                        self._device.state,
                     )
 
         return None
@@ -150,12 +167,10 @@ class Lock(HardwareBaseDevice, LockEntity):  # type: ignore
     # Helpers
     #
 
-    def _validate_code(self, code: str | None) -> bool | str:
+    def _validate_code(self, code: str | None) -> bool:
         """Validate given code."""
-        check: bool | str = (arm_code := self._controller.options.get(CONF_ARM_CODE)) in [
-            None,
-            "",
-        ] or code == arm_code
-        if not check:
-            LOGGER.warning("Wrong code entered.")
-        return check
+        if self._arm_code is None or code == self._arm_code:
+            return True
+
+        LOGGER.warning("Wrong code entered.")
+        return False
@@ -33,17 +33,17 @@ async def async_setup_entry(
 
     controller: AlarmIntegrationController = hass.data[DOMAIN][config_entry.entry_id][DATA_CONTROLLER]
 
-    for device in controller.api.devices.cameras.values():
-        async_add_entities(
-            ConfigOptionNumber(
-                controller=controller,
-                device=device,
-                config_option=config_option,
-            )
-            for config_option in device.settings.values()
-            if isinstance(config_option, libConfigurationOption)
-            and config_option.option_type is libConfigurationOptionType.BRIGHTNESS
+    async_add_entities(
+        ConfigOptionNumber(
+            controller=controller,
+            device=device,
+            config_option=config_option,
         )
+        for device in controller.api.devices.cameras.values()
+        for config_option in device.settings.values()
+        if isinstance(config_option, libConfigurationOption)
+        and config_option.option_type is libConfigurationOptionType.BRIGHTNESS
+    )
 
 
 class ConfigOptionNumber(ConfigBaseDevice, NumberEntity):  # type: ignore
@@ -38,21 +38,21 @@ async def async_setup_entry(
 
     controller: AlarmIntegrationController = hass.data[DOMAIN][config_entry.entry_id][DATA_CONTROLLER]
 
-    for device in controller.api.devices.cameras.values():
-        async_add_entities(
-            ConfigOptionSelect(
-                controller=controller,
-                device=device,
-                config_option=config_option,
-            )
-            for config_option in device.settings.values()
-            if isinstance(config_option, libConfigurationOption)
-            and config_option.option_type
-            in [
-                libConfigurationOptionType.ADJUSTABLE_CHIME,
-                libConfigurationOptionType.MOTION_SENSITIVITY,
-            ]
+    async_add_entities(
+        ConfigOptionSelect(
+            controller=controller,
+            device=device,
+            config_option=config_option,
         )
+        for device in controller.api.devices.cameras.values()
+        for config_option in device.settings.values()
+        if isinstance(config_option, libConfigurationOption)
+        and config_option.option_type
+        in [
+            libConfigurationOptionType.ADJUSTABLE_CHIME,
+            libConfigurationOptionType.MOTION_SENSITIVITY,
+        ]
+    )
 
 
 class ConfigOptionSelect(ConfigBaseDevice, SelectEntity):  # type: ignore
@@ -93,6 +93,11 @@ class ConfigOptionSelect(ConfigBaseDevice, SelectEntity):  # type: ignore
 
         self._attr_options: list = list(self._select_options_map.keys())
 
+        # Reverse lookup so current_option doesn't rebuild option names on every read.
+        self._select_option_names: dict[Enum, str] = {
+            member: name for name, member in self._select_options_map.items()
+        }
+
     @property
     def icon(self) -> str | None:
         """Return the icon to use in the frontend, if any."""
@@ -117,7 +122,7 @@ class ConfigOptionSelect(ConfigBaseDevice, SelectEntity):  # type: ignore
         """Return the selected option."""
 
         if isinstance(current_value := self._config_option.current_value, Enum):
-            return current_value.name.title().replace("_", " ")
+            return self._select_option_names.get(current_value) or current_value.name.title().replace("_", " ")
         return None
 
     async def async_select_option(self, option: str) -> None:
@@ -35,17 +35,17 @@ async def async_setup_entry(
 
     controller: AlarmIntegrationController = hass.data[DOMAIN][config_entry.entry_id][DATA_CONTROLLER]
 
-    for device in controller.api.devices.cameras.values():
-        async_add_entities(
-            ConfigOptionSwitch(
-                controller=controller,
-                device=device,
-                config_option=config_option,
-            )
-            for config_option in device.settings.values()
-            if isinstance(config_option, libConfigurationOption)
-            and config_option.option_type is libConfigurationOptionType.BINARY_CHIME
+    async_add_entities(
+        ConfigOptionSwitch(
+            controller=controller,
+            device=device,
+            config_option=config_option,
         )
+        for device in controller.api.devices.cameras.values()
+        for config_option in device.settings.values()
+        if isinstance(config_option, libConfigurationOption)
+        and config_option.option_type is libConfigurationOptionType.BINARY_CHIME
+    )
 
 
 class ConfigOptionSwitch(ConfigBaseDevice, SwitchEntity):  # type: ignore
@@ -73,7 +73,7 @@ class ConfigOptionSwitch(ConfigBaseDevice, SwitchEntity):  # type: ignore
             libCameraSkybellControllerExtension.ChimeOnOff.ON,
         )
 
-        await self._controller.update_coordinator.async_refresh()
+        await self._controller.update_coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs) -> None:  # type: ignore
         """Turn off."""
@@ -82,4 +82,4 @@ class ConfigOptionSwitch(ConfigBaseDevice, SwitchEntity):  # type: ignore
             libCameraSkybellControllerExtension.ChimeOnOff.OFF,
         )
 
-        await self._controller.update_coordinator.async_refresh()
+        await self._controller.update_coordinator.async_request_refresh()